@@ -1,5 +1,25 @@
+import heapq
+import math
+from collections import OrderedDict
+
 from ortools.linear_solver import pywraplp
 
+from ExtracaoResultados import extrair_resultado_ortools
+
+# Arcos (origem, destino, custo) da rede de exemplo
+ARCOS_COM_CUSTOS = [
+    ('A', 'B', 8), ('A', 'C', 5), ('A', 'D', 7),
+    ('B', 'E', 6), ('B', 'F', 2),
+    ('C', 'B', 5), ('C', 'F', 4),
+    ('D', 'F', 4), ('D', 'G', 2),
+    ('E', 'H', 4),
+    ('F', 'E', 4), ('F', 'H', 2), ('F', 'I', 5), ('F', 'G', 4),
+    ('G', 'I', 2), ('G', 'J', 4),
+    ('H', 'K', 4),
+    ('I', 'H', 4), ('I', 'K', 5),
+    ('J', 'I', 2), ('J', 'K', 4),
+]
+
 def resolver_caminho_minimo_pl():
     """
     Formula e resolve o problema do caminho mínimo como um problema de
@@ -22,18 +42,7 @@ def resolver_caminho_minimo_pl():
     reverse_node_map = {v: k for k, v in node_map.items()}
 
     # 3. Definir os Dados do Problema (Arcos e Custos)
-    arcos_com_custos = [
-        ('A', 'B', 8), ('A', 'C', 5), ('A', 'D', 7),
-        ('B', 'E', 6), ('B', 'F', 2),
-        ('C', 'B', 5), ('C', 'F', 4),
-        ('D', 'F', 4), ('D', 'G', 2),
-        ('E', 'H', 4),
-        ('F', 'E', 4), ('F', 'H', 2), ('F', 'I', 5), ('F', 'G', 4),
-        ('G', 'I', 2), ('G', 'J', 4),
-        ('H', 'K', 4),
-        ('I', 'H', 4), ('I', 'K', 5),
-        ('J', 'I', 2), ('J', 'K', 4),
-    ]
+    arcos_com_custos = ARCOS_COM_CUSTOS
 
     # 4. Definir as Variáveis de Decisão
     # x[i, j] é uma variável binária que é 1 se o arco (i, j) está no caminho, e 0 caso contrário.
@@ -76,20 +85,262 @@ def resolver_caminho_minimo_pl():
         print('--- Trajeto Ótimo Encontrado ---')
         print(f'Custo Mínimo de Construção: {solver.Objective().Value():.0f}\n')
         
-        # Reconstruir o caminho a partir das variáveis
+        # Reconstruir o caminho a partir dos arcos escolhidos (extraídos em bloco)
+        # As variáveis foram criadas na ordem dos arcos em x, que é a ordem do modelo
+        arcos = list(x.keys())
+        resultado = extrair_resultado_ortools(solver, status=status)
+        proximo = {arcos[k][0]: arcos[k][1] for k in resultado.indices_nao_nulos(tolerancia=0.9)}
+
         caminho = ['A']
         no_atual_idx = start_node_idx
         while no_atual_idx != end_node_idx:
-            for i, j in x:
-                if i == no_atual_idx and x[i, j].solution_value() > 0.9:
-                    no_atual_idx = j
-                    caminho.append(reverse_node_map[no_atual_idx])
-                    break
+            no_atual_idx = proximo[no_atual_idx]
+            caminho.append(reverse_node_map[no_atual_idx])
         
         caminho_formatado = ' -> '.join(caminho)
         print(f'Caminho: {caminho_formatado}')
+        return resultado
     else:
         print('Não foi possível encontrar um caminho ótimo.')
 
+
+# --------------------------------------------------------------------------
+# K caminhos mínimos sem ciclos (algoritmo de Yen)
+# --------------------------------------------------------------------------
+def _montar_grafo(arcos):
+    """Aceita [(i, j, custo), ...] ou {(i, j): custo} e retorna listas de sucessores e predecessores."""
+    if isinstance(arcos, dict):
+        custos = arcos
+    else:
+        custos = {}
+        for i, j, custo in arcos:
+            # Arcos paralelos: mantém apenas o mais barato
+            if (i, j) not in custos or custo < custos[i, j]:
+                custos[i, j] = custo
+    if custos and min(custos.values()) < 0:
+        raise ValueError('O algoritmo de Yen exige custos não negativos em todos os arcos.')
+
+    sucessores = {}
+    predecessores = {}
+    for (i, j), custo in custos.items():
+        sucessores.setdefault(i, []).append((j, custo))
+        predecessores.setdefault(j, []).append((i, custo))
+    return sucessores, predecessores
+
+
+def _arvore_ate_destino(predecessores, destino):
+    """
+    Dijkstra reverso a partir do destino: distância de cada nó até o destino e o
+    próximo nó no caminho mínimo (árvore de caminhos mínimos enraizada no destino).
+    """
+    distancia = {destino: 0}
+    proximo = {destino: None}
+    heap = [(0, 0, destino)]
+    contador = 1
+    while heap:
+        d, _, v = heapq.heappop(heap)
+        if d > distancia[v]:
+            continue
+        for u, custo in predecessores.get(v, ()):
+            nd = d + custo
+            if nd < distancia.get(u, math.inf):
+                distancia[u] = nd
+                proximo[u] = v
+                heapq.heappush(heap, (nd, contador, u))
+                contador += 1
+    return distancia, proximo
+
+
+class GrafoCaminhos:
+    """
+    Grafo pronto para consultas repetidas de k_caminhos_minimos: as listas de sucessores
+    e predecessores são montadas uma única vez, e a árvore reversa de cada destino é
+    guardada em cache (as `max_arvores` mais recentes). O grafo não deve ser alterado
+    depois de criado.
+    """
+
+    def __init__(self, arcos, max_arvores=8):
+        self.sucessores, self.predecessores = _montar_grafo(arcos)
+        self.max_arvores = max_arvores
+        self._arvores = OrderedDict()
+
+    def arvore(self, destino):
+        """Retorna (distancia, proximo) da árvore de caminhos mínimos até `destino`."""
+        if destino in self._arvores:
+            self._arvores.move_to_end(destino)
+            return self._arvores[destino]
+        arvore = _arvore_ate_destino(self.predecessores, destino)
+        if self.max_arvores > 0:
+            self._arvores[destino] = arvore
+            if len(self._arvores) > self.max_arvores:
+                self._arvores.popitem(last=False)
+        return arvore
+
+
+def _ramo(proximo, no):
+    """Caminho de `no` até o destino seguindo a árvore de caminhos mínimos."""
+    caminho = []
+    while no is not None:
+        caminho.append(no)
+        no = proximo[no]
+    return caminho
+
+
+def _caminho_desvio(sucessores, distancia, proximo, desvio, bloqueados, arcos_removidos, limite):
+    """
+    Menor caminho de `desvio` até o destino sem passar pelos nós bloqueados (a raiz) nem
+    pelos arcos removidos em `desvio`. Usa A* guiado pela árvore reversa: como a distância
+    até o destino no grafo completo é uma heurística exata, a busca termina assim que
+    alcança um nó cujo ramo na árvore não toca nenhum nó bloqueado.
+    Retorna (custo, trecho) em que o trecho vai de `desvio` até o nó em que o caminho
+    passa a seguir a árvore, ou None se não houver caminho com custo menor que `limite`.
+    """
+    # livre[u]: o ramo da árvore a partir de u evita os nós bloqueados e o próprio desvio
+    livre = {None: True, desvio: False}
+    g = {desvio: 0}
+    anterior = {desvio: None}
+    heap = []
+    contador = 0
+    for v, custo in sucessores.get(desvio, ()):
+        if v in bloqueados or v in arcos_removidos or v not in distancia:
+            continue
+        if custo < g.get(v, math.inf):
+            g[v] = custo
+            anterior[v] = desvio
+            heapq.heappush(heap, (custo + distancia[v], contador, v))
+            contador += 1
+
+    fechados = set()
+    while heap:
+        f, _, u = heapq.heappop(heap)
+        if f >= limite:
+            return None
+        if u in fechados:
+            continue
+        fechados.add(u)
+
+        # Verifica (com memorização) se o ramo da árvore a partir de u está livre
+        pilha = []
+        w = u
+        while w not in livre:
+            if w in bloqueados:
+                livre[w] = False
+                break
+            pilha.append(w)
+            w = proximo[w]
+        ok = livre[w]
+        for w in pilha:
+            livre[w] = ok
+
+        if ok:
+            # O restante do caminho é o próprio ramo da árvore, que é ótimo
+            trecho = []
+            w = u
+            while w is not None:
+                trecho.append(w)
+                w = anterior[w]
+            trecho.reverse()
+            return f, trecho
+        for v, custo in sucessores.get(u, ()):
+            if v == desvio or v in bloqueados or v in fechados or v not in distancia:
+                continue
+            nd = g[u] + custo
+            if nd < g.get(v, math.inf):
+                g[v] = nd
+                anterior[v] = u
+                heapq.heappush(heap, (nd + distancia[v], contador, v))
+                contador += 1
+    return None
+
+
+def k_caminhos_minimos(arcos, origem, destino, k):
+    """
+    Retorna até k caminhos sem ciclos de `origem` a `destino`, em ordem crescente de custo,
+    usando o algoritmo de Yen.
+    Argumentos:
+        arcos (list, dict ou GrafoCaminhos): Arcos como em ARCOS_COM_CUSTOS [(i, j, custo), ...],
+            como o dicionário `trechos` {(i, j): custo} ou um GrafoCaminhos já montado, que
+            evita remontar o grafo e refazer a árvore reversa em consultas repetidas.
+            Os custos devem ser não negativos.
+        origem, destino: Nós de partida e de chegada.
+        k (int): Quantidade máxima de caminhos.
+    Retorno:
+        list of (custo, caminho), onde caminho é a lista de nós visitados.
+    """
+    grafo = arcos if isinstance(arcos, GrafoCaminhos) else GrafoCaminhos(arcos, max_arvores=0)
+    sucessores = grafo.sucessores
+    # A árvore reversa é calculada uma única vez e reaproveitada em todos os desvios
+    distancia, proximo = grafo.arvore(destino)
+    if k <= 0 or origem not in distancia:
+        return []
+
+    aceitos = [(distancia[origem], _ramo(proximo, origem))]
+
+    # Trie dos caminhos aceitos: cada nó da trie guarda os próximos nós já usados após
+    # aquele prefixo, ou seja, os arcos que devem ser removidos no desvio correspondente
+    trie = {}
+    # Candidatos guardam apenas (caminho pai, índice do desvio, trecho); o caminho completo
+    # só é montado quando o candidato é aceito
+    candidatos = []
+    gerados = set()
+    contador = 0
+    indice_desvio = 0
+
+    while len(aceitos) < k:
+        _, caminho = aceitos[-1]
+        no_trie = trie
+        for no in caminho[1:]:
+            no_trie = no_trie.setdefault(no, {})
+
+        # Limiar: custo do m-ésimo melhor candidato, com m = caminhos que ainda faltam.
+        # Desvios que não conseguem ficar abaixo dele nunca seriam aceitos.
+        faltam = k - len(aceitos)
+        limiares = [-c for c, *_ in heapq.nsmallest(faltam, candidatos)]
+        heapq.heapify(limiares)
+
+        # Percorre a raiz compartilhada; só vale desviar a partir do ponto em que este
+        # caminho se separou do caminho que o gerou (os desvios anteriores já foram feitos)
+        bloqueados = set()
+        custo_raiz = 0
+        no_trie = trie
+        for i in range(len(caminho) - 1):
+            desvio = caminho[i]
+            limite = -limiares[0] if len(limiares) == faltam else math.inf
+            if i >= indice_desvio and custo_raiz + distancia[desvio] < limite:
+                resultado = _caminho_desvio(sucessores, distancia, proximo, desvio,
+                                            bloqueados, no_trie, limite - custo_raiz)
+                if resultado is not None:
+                    custo_desvio, trecho = resultado
+                    # Forma canônica do trecho: corta a parte final que já segue a árvore
+                    while len(trecho) > 1 and proximo[trecho[-2]] == trecho[-1]:
+                        trecho.pop()
+                    # O mesmo prefixo corresponde sempre ao mesmo nó da trie
+                    chave = (id(no_trie), tuple(trecho))
+                    if chave not in gerados:
+                        gerados.add(chave)
+                        custo = custo_raiz + custo_desvio
+                        heapq.heappush(candidatos, (custo, contador, caminho, i, trecho))
+                        contador += 1
+                        if len(limiares) < faltam:
+                            heapq.heappush(limiares, -custo)
+                        elif custo < -limiares[0]:
+                            heapq.heapreplace(limiares, -custo)
+            bloqueados.add(desvio)
+            seguinte = caminho[i + 1]
+            custo_raiz += next(c for v, c in sucessores[desvio] if v == seguinte)
+            no_trie = no_trie[seguinte]
+
+        if not candidatos:
+            break
+        custo, _, pai, indice_desvio, trecho = heapq.heappop(candidatos)
+        aceitos.append((custo, pai[:indice_desvio] + trecho[:-1] + _ramo(proximo, trecho[-1])))
+
+    return aceitos
+
+
 if __name__ == '__main__':
     resolver_caminho_minimo_pl()
+
+    print('\n--- 5 Caminhos Mínimos Alternativos (Yen) ---')
+    for posicao, (custo, caminho) in enumerate(k_caminhos_minimos(ARCOS_COM_CUSTOS, 'A', 'K', 5), start=1):
+        print(f'{posicao}. Custo {custo}: {" -> ".join(caminho)}')
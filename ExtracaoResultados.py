@@ -0,0 +1,216 @@
+import csv
+
+import numpy as np
+
+
+class ResultadoSolucao:
+    """
+    Guarda o resultado de um modelo resolvido em vetores NumPy alinhados ao
+    índice das variáveis (arcos) e das restrições do modelo.
+    """
+
+    def __init__(self, status, objetivo, nomes_variaveis, valores, custos_reduzidos,
+                 nomes_restricoes, duais):
+        # Os nomes podem ser listas ou funções sem argumentos; no segundo caso só são
+        # consultados no solver quando alguém (ex.: um gravador) precisa deles
+        self.status = status
+        self.objetivo = objetivo
+        self._nomes_variaveis = nomes_variaveis
+        self.valores = valores
+        self.custos_reduzidos = custos_reduzidos
+        self._nomes_restricoes = nomes_restricoes
+        self.duais = duais
+
+    @property
+    def nomes_variaveis(self):
+        if callable(self._nomes_variaveis):
+            self._nomes_variaveis = self._nomes_variaveis()
+        return self._nomes_variaveis
+
+    @property
+    def nomes_restricoes(self):
+        if callable(self._nomes_restricoes):
+            self._nomes_restricoes = self._nomes_restricoes()
+        return self._nomes_restricoes
+
+    def indices_nao_nulos(self, tolerancia=1e-9):
+        """Retorna os índices das variáveis com valor diferente de zero."""
+        return np.flatnonzero(np.abs(self.valores) > tolerancia)
+
+    def escrever_csv(self, caminho, tolerancia=1e-9, tamanho_bloco=100_000):
+        """Grava apenas as variáveis não nulas em um arquivo CSV."""
+        escrever_nao_nulos_csv(caminho, self._colunas_variaveis(), 'valor', tolerancia, tamanho_bloco)
+
+    def escrever_parquet(self, caminho, tolerancia=1e-9, tamanho_bloco=100_000):
+        """Grava apenas as variáveis não nulas em um arquivo Parquet."""
+        escrever_nao_nulos_parquet(caminho, self._colunas_variaveis(), 'valor', tolerancia, tamanho_bloco,
+                                   colunas_texto=('variavel',))
+
+    def escrever_duais_csv(self, caminho, tolerancia=1e-9, tamanho_bloco=100_000):
+        """Grava apenas as restrições com dual não nulo em um arquivo CSV."""
+        escrever_nao_nulos_csv(caminho, self._colunas_restricoes(), 'dual', tolerancia, tamanho_bloco)
+
+    def escrever_duais_parquet(self, caminho, tolerancia=1e-9, tamanho_bloco=100_000):
+        """Grava apenas as restrições com dual não nulo em um arquivo Parquet."""
+        escrever_nao_nulos_parquet(caminho, self._colunas_restricoes(), 'dual', tolerancia, tamanho_bloco,
+                                   colunas_texto=('restricao',))
+
+    def _colunas_variaveis(self):
+        return {
+            'variavel': self.nomes_variaveis,
+            'valor': self.valores,
+            'custo_reduzido': self.custos_reduzidos,
+        }
+
+    def _colunas_restricoes(self):
+        return {
+            'restricao': self.nomes_restricoes,
+            'dual': self.duais,
+        }
+
+
+# --------------------------------------------------------------------------
+# Extração em bloco
+# --------------------------------------------------------------------------
+def indices_ortools(variaveis):
+    """
+    Índices no modelo das variáveis informadas, para reaproveitar em várias chamadas de
+    extrair_resultado_ortools (custa uma chamada ao OR-Tools por variável).
+    """
+    return np.fromiter((v.index() for v in variaveis), dtype=np.int64, count=len(variaveis))
+
+
+def extrair_resultado_ortools(solver, indices=None, status=None):
+    """
+    Extrai valores primais, duais e custos reduzidos de um solver do OR-Tools
+    em uma única chamada (via MPSolutionResponse), sem consultar variável por variável.
+    Argumentos:
+        solver (pywraplp.Solver): Solver já resolvido.
+        indices (np.ndarray): Índices no modelo na ordem desejada (ex.: arcos), obtidos com
+            indices_ortools. Padrão: ordem em que as variáveis foram criadas no modelo.
+        status (int): Status retornado por solver.Solve(), apenas repassado ao resultado.
+    """
+    from ortools.linear_solver import linear_solver_pb2
+
+    resposta = linear_solver_pb2.MPSolutionResponse()
+    solver.FillSolutionResponseProto(resposta)
+    n = solver.NumVariables() if indices is None else len(indices)
+
+    def reordenar(vetor):
+        vetor = np.asarray(vetor, dtype=float)
+        if not vetor.size:
+            return np.full(n, np.nan)
+        return vetor if indices is None else vetor[indices]
+
+    # Duais e custos reduzidos só existem para modelos contínuos (ex.: GLOP)
+    valores = reordenar(resposta.variable_value)
+    custos_reduzidos = reordenar(resposta.reduced_cost)
+    duais = np.asarray(resposta.dual_value, dtype=float)
+    if not duais.size:
+        duais = np.full(solver.NumConstraints(), np.nan)
+
+    def nomes_variaveis():
+        variaveis = solver.variables()
+        ordem = range(len(variaveis)) if indices is None else indices
+        return [variaveis[k].name() for k in ordem]
+
+    return ResultadoSolucao(
+        status=status,
+        objetivo=resposta.objective_value,
+        nomes_variaveis=nomes_variaveis,
+        valores=valores,
+        custos_reduzidos=custos_reduzidos,
+        nomes_restricoes=lambda: [c.name() for c in solver.constraints()],
+        duais=duais,
+    )
+
+
+def extrair_resultado_pulp(modelo, variaveis=None):
+    """
+    Extrai valores primais, duais e custos reduzidos de um modelo PuLP para vetores NumPy.
+    Argumentos:
+        modelo (pulp.LpProblem): Modelo já resolvido.
+        variaveis (list): Ordem desejada das variáveis (ex.: list(vars_rotas.values())).
+            Padrão: modelo.variables(), que ordena pelo nome.
+    """
+    import pulp
+
+    if variaveis is None:
+        variaveis = modelo.variables()
+    n = len(variaveis)
+
+    valores = np.fromiter((_ou_nan(v.varValue) for v in variaveis), dtype=float, count=n)
+    custos_reduzidos = np.fromiter((_ou_nan(v.dj) for v in variaveis), dtype=float, count=n)
+
+    restricoes = modelo.constraints
+    duais = np.fromiter((_ou_nan(c.pi) for c in restricoes.values()), dtype=float, count=len(restricoes))
+
+    return ResultadoSolucao(
+        status=pulp.LpStatus[modelo.status],
+        objetivo=pulp.value(modelo.objective),
+        nomes_variaveis=lambda: [v.name for v in variaveis],
+        valores=valores,
+        custos_reduzidos=custos_reduzidos,
+        nomes_restricoes=lambda: list(restricoes.keys()),
+        duais=duais,
+    )
+
+
+def _ou_nan(valor):
+    return np.nan if valor is None else valor
+
+
+# --------------------------------------------------------------------------
+# Gravação em blocos (somente entradas não nulas)
+# --------------------------------------------------------------------------
+def _blocos_nao_nulos(colunas, chave, tolerancia, tamanho_bloco):
+    """Gera, bloco a bloco, as colunas restritas às linhas em que `chave` é não nula."""
+    indices = np.flatnonzero(np.abs(np.asarray(colunas[chave], dtype=float)) > tolerancia)
+    arrays = {nome: np.asarray(valores) for nome, valores in colunas.items()}
+    for inicio in range(0, len(indices), tamanho_bloco):
+        bloco = indices[inicio:inicio + tamanho_bloco]
+        yield {nome: valores[bloco] for nome, valores in arrays.items()}
+
+
+def escrever_nao_nulos_csv(caminho, colunas, chave='valor', tolerancia=1e-9, tamanho_bloco=100_000):
+    """
+    Grava em CSV apenas as linhas cuja coluna `chave` é não nula, em blocos.
+    Argumentos:
+        caminho (str): Arquivo de saída.
+        colunas (dict): Nome da coluna -> sequência alinhada ao índice das variáveis.
+        chave (str): Coluna usada para filtrar os valores nulos.
+        tolerancia (float): Valores com módulo até a tolerância são considerados zero.
+        tamanho_bloco (int): Quantidade de linhas gravadas por vez.
+    """
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(list(colunas.keys()))
+        for bloco in _blocos_nao_nulos(colunas, chave, tolerancia, tamanho_bloco):
+            escritor.writerows(zip(*(valores.tolist() for valores in bloco.values())))
+
+
+def escrever_nao_nulos_parquet(caminho, colunas, chave='valor', tolerancia=1e-9, tamanho_bloco=100_000,
+                               colunas_texto=()):
+    """
+    Grava em Parquet (formato colunar) apenas as linhas cuja coluna `chave` é não nula,
+    um row group por bloco. Requer a biblioteca pyarrow.
+    As colunas em `colunas_texto` são sempre gravadas como string, mesmo quando vazias;
+    as demais têm o tipo deduzido do dtype NumPy.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as erro:
+        raise ImportError("A gravação em Parquet requer a biblioteca pyarrow (pip install pyarrow).") from erro
+
+    # Esquema fixo, definido antes de ler os dados e não pelo conteúdo de cada bloco
+    esquema = pa.schema([
+        (nome, pa.string() if nome in colunas_texto or tipo.kind in 'OU' else pa.from_numpy_dtype(tipo))
+        for nome, tipo in ((nome, np.asarray(valores).dtype) for nome, valores in colunas.items())
+    ])
+    texto = {campo.name for campo in esquema if pa.types.is_string(campo.type)}
+    with pq.ParquetWriter(caminho, esquema) as escritor:
+        for bloco in _blocos_nao_nulos(colunas, chave, tolerancia, tamanho_bloco):
+            escritor.write_table(pa.table(
+                {nome: valores.tolist() if nome in texto else valores for nome, valores in bloco.items()},
+                schema=esquema))
@@ -1,5 +1,7 @@
 from ortools.linear_solver import pywraplp
 
+from ExtracaoResultados import extrair_resultado_ortools
+
 
 def resolver_fluxo_com_pl_arco_imaginario():
     """
@@ -62,14 +64,19 @@ def resolver_fluxo_com_pl_arco_imaginario():
 
         nomes_nos = {0: 'A', 1: '1', 2: '2', 3: '3', 4: '4', 5: 'B'}
 
-        for (i, j), var in f.items():
+        # Extrai todos os fluxos de uma vez; as variáveis foram criadas na ordem dos arcos em f
+        arcos = list(f.keys())
+        resultado = extrair_resultado_ortools(solver, status=status)
+
+        for k in resultado.indices_nao_nulos(tolerancia=1e-6):
+            i, j = arcos[k]
             # Não exibir o arco imaginário no resultado final dos fluxos
             if (i, j) == (5, 0):
                 continue
-            if var.solution_value() > 1e-6:
-                no_inicio = nomes_nos[i]
-                no_fim = nomes_nos[j]
-                print(f'  - Fluxo do Nó {no_inicio} para {no_fim}: {var.solution_value():.2f} m³/s')
+            no_inicio = nomes_nos[i]
+            no_fim = nomes_nos[j]
+            print(f'  - Fluxo do Nó {no_inicio} para {no_fim}: {resultado.valores[k]:.2f} m³/s')
+        return resultado
     else:
         print('Não foi possível encontrar uma solução ótima.')
 
@@ -1,5 +1,7 @@
 import pulp
 
+from ExtracaoResultados import extrair_resultado_pulp
+
 
 # --------------------------------------------------------------------------
 # Problema 1: Rota Mínima (Chapecó → Porto Alegre)
@@ -246,9 +248,13 @@ def resolver_transporte():
     if pulp.LpStatus[modelo.status] == 'Optimal':
         print(f"Custo Mínimo de Transporte: R$ {pulp.value(modelo.objective):.2f}")
         print("Plano de envio:")
-        for rota in custos:
-            if vars_rotas[rota].varValue > 0:
-                print(f"  De {rota[0]} para {rota[1]}: {int(vars_rotas[rota].varValue)} unidades")
+        # Extrai todas as quantidades de uma vez, alinhadas à ordem das rotas em custos
+        rotas = list(custos.keys())
+        resultado = extrair_resultado_pulp(modelo, [vars_rotas[rota] for rota in rotas])
+        for k in resultado.indices_nao_nulos():
+            rota = rotas[k]
+            print(f"  De {rota[0]} para {rota[1]}: {int(resultado.valores[k])} unidades")
+        return resultado
 
 
 # --------------------------------------------------------------------------
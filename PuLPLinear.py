@@ -1,5 +1,7 @@
 import pulp as plp
 
+from ExtracaoResultados import extrair_resultado_pulp
+
 def resolver_pl(titulo, tipo_otimizacao, coeficientes_objetivo, restricoes):
     """
     Função para resolver um problema de programação linear usando PuLP.
@@ -40,9 +42,11 @@ def resolver_pl(titulo, tipo_otimizacao, coeficientes_objetivo, restricoes):
     print(f"Status: {plp.LpStatus[modelo.status]}")
     if modelo.status == plp.LpStatusOptimal:
         print("Solução Ótima:")
-        for var in modelo.variables():
-            print(f"  {var.name} = {var.varValue}")
-        print(f"Valor Ótimo (Z): {plp.value(modelo.objective)}\n")
+        resultado = extrair_resultado_pulp(modelo, variaveis)
+        for nome, valor in zip(resultado.nomes_variaveis, resultado.valores):
+            print(f"  {nome} = {valor}")
+        print(f"Valor Ótimo (Z): {resultado.objetivo}\n")
+        return resultado
     else:
         print("Não foi encontrada uma solução ótima (o problema pode ser inviável ou ilimitado).\n")
 
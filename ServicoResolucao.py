@@ -0,0 +1,543 @@
+"""
+Serviço local (asyncio) que resolve problemas de PL, caminho mínimo, fluxo máximo e
+transporte recebidos como JSON, uma requisição por linha, via socket Unix ou localhost.
+
+Requisição:  {"id": 1, "tipo": "pl", "dados": {...}, "prazo": 2.0}
+Resposta:    {"id": 1, "ok": true, "resultado": {...}}  ou  {"id": 1, "ok": false, "erro": "..."}
+
+Formatos de "dados" (os mesmos dicionários usados nos scripts; arcos como [i, j, valor]):
+    pl:             {"tipo": "max" | "min", "objetivo": [4, 3], "restricoes": [{"coefs": [1, 3], "op": "<=", "rhs": 7}]}
+    caminho_minimo: {"arcos": [["A", "B", 8], ...], "origem": "A", "destino": "K"}
+    fluxo_maximo:   {"capacidades": [["C", "1", 8], ...], "origem": "C", "destino": "R"}
+    transporte:     {"custos": [["SP", "VIT", 9], ...], "capacidade": {"SP": 150}, "demanda": {"BSB": 130}}
+O tipo "stats" retorna as estatísticas de fila e latência do serviço.
+
+Cada processo do pool cria uma vez os solvers do OR-Tools (GLOP e CBC) e os reaproveita,
+limpos, em todas as requisições. Os lotes juntam requisições de mesmo tipo e tamanho apenas
+para reduzir idas e voltas ao pool: cada requisição continua sendo um modelo resolvido à
+parte, em sequência, no solver do trabalhador que recebeu o lote.
+"""
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from ortools.linear_solver import pywraplp
+
+from ExtracaoResultados import extrair_resultado_ortools
+
+# Tamanho máximo de uma linha JSON (requisição ou resposta); o padrão do asyncio é 64 KiB
+LIMITE_LINHA = 256 * 1024 * 1024
+
+
+# --------------------------------------------------------------------------
+# Trabalhadores (executados no pool de processos)
+# --------------------------------------------------------------------------
+# Solvers do OR-Tools criados uma vez por processo e reaproveitados (com Clear) em todas
+# as requisições: GLOP para os problemas contínuos e CBC para os inteiros
+_SOLVERS = {}
+
+# Barreira compartilhada pelos trabalhadores, usada apenas no aquecimento do pool
+_BARREIRA = None
+
+_STATUS = {
+    pywraplp.Solver.OPTIMAL: 'Optimal',
+    pywraplp.Solver.FEASIBLE: 'Feasible',
+    pywraplp.Solver.INFEASIBLE: 'Infeasible',
+    pywraplp.Solver.UNBOUNDED: 'Unbounded',
+    pywraplp.Solver.ABNORMAL: 'Abnormal',
+    pywraplp.Solver.MODEL_INVALID: 'Model Invalid',
+    pywraplp.Solver.NOT_SOLVED: 'Not Solved',
+}
+
+
+def _inicializar_trabalhador(barreira=None):
+    """Cria os solvers do OR-Tools uma única vez por processo do pool."""
+    global _BARREIRA
+    _BARREIRA = barreira
+    for nome in ('GLOP', 'CBC'):
+        _SOLVERS[nome] = pywraplp.Solver.CreateSolver(nome)
+
+
+def _solver(nome):
+    """Solver já carregado do processo, limpo para receber um novo modelo."""
+    solver = _SOLVERS[nome]
+    solver.Clear()
+    return solver
+
+
+def _resolver(solver):
+    status = solver.Solve()
+    return _STATUS.get(status, str(status)), extrair_resultado_ortools(solver, status=status)
+
+
+def _balanco_por_no(solver, rotas, variaveis, limites):
+    """
+    Cria uma restrição lb <= saída - entrada <= ub para cada nó em `limites`
+    ({no: (lb, ub, nome)}), percorrendo os arcos uma única vez.
+    """
+    restricoes = {no: solver.Constraint(lb, ub, nome) for no, (lb, ub, nome) in limites.items()}
+    for (i, j), x in zip(rotas, variaveis):
+        if i == j:
+            continue
+        if i in restricoes:
+            restricoes[i].SetCoefficient(x, 1)
+        if j in restricoes:
+            restricoes[j].SetCoefficient(x, -1)
+
+
+def _arcos(dados):
+    """Converte [[i, j, valor], ...] em {(i, j): valor}."""
+    # Objetos JSON só têm chaves string, que não representam um arco (i, j) sem ambiguidade
+    if not isinstance(dados, list):
+        raise ValueError(f'Arcos devem ser uma lista [[i, j, valor], ...], não {type(dados).__name__}.')
+    arcos = {}
+    for arco in dados:
+        if not isinstance(arco, list) or len(arco) != 3:
+            raise ValueError(f'Arco inválido {arco!r}: esperado [i, j, valor].')
+        i, j, valor = arco
+        arcos[i, j] = valor
+    return arcos
+
+
+def _nos(arcos):
+    nos = []
+    vistos = set()
+    for i, j in arcos:
+        for no in (i, j):
+            if no not in vistos:
+                vistos.add(no)
+                nos.append(no)
+    return nos
+
+
+def _arcos_nao_nulos(rotas, resultado):
+    return [[rotas[k][0], rotas[k][1], float(resultado.valores[k])] for k in resultado.indices_nao_nulos()]
+
+
+def _resolver_pl(dados):
+    solver = _solver('GLOP')
+    infinito = solver.infinity()
+    variaveis = [solver.NumVar(0, infinito, f'x{i + 1}') for i in range(len(dados['objetivo']))]
+
+    objetivo = solver.Objective()
+    for c, x in zip(dados['objetivo'], variaveis):
+        objetivo.SetCoefficient(x, c)
+    if dados['tipo'] in ('max', -1):
+        objetivo.SetMaximization()
+    else:
+        objetivo.SetMinimization()
+
+    limites = {'<=': lambda rhs: (-infinito, rhs), '>=': lambda rhs: (rhs, infinito), '==': lambda rhs: (rhs, rhs)}
+    for i, r in enumerate(dados['restricoes']):
+        if r['op'] not in limites:
+            raise ValueError(f"Operador de restrição inválido: {r['op']}")
+        restricao = solver.Constraint(*limites[r['op']](r['rhs']), f'Restricao_{i + 1}')
+        for c, x in zip(r['coefs'], variaveis):
+            restricao.SetCoefficient(x, c)
+
+    status, resultado = _resolver(solver)
+    return {
+        'status': status,
+        'objetivo': resultado.objetivo,
+        'variaveis': dict(zip(resultado.nomes_variaveis, resultado.valores.tolist())),
+        'duais': dict(zip(resultado.nomes_restricoes, resultado.duais.tolist())),
+    }
+
+
+def _resolver_caminho_minimo(dados):
+    trechos = _arcos(dados['arcos'])
+    origem, destino = dados['origem'], dados['destino']
+    solver = _solver('CBC')
+    rotas = list(trechos.keys())
+    x = [solver.BoolVar(f'x_{k}') for k in range(len(rotas))]
+
+    objetivo = solver.Objective()
+    for k, rota in enumerate(rotas):
+        objetivo.SetCoefficient(x[k], trechos[rota])
+    objetivo.SetMinimization()
+
+    limites = {}
+    for no in _nos(trechos):
+        balanco = 1 if no == origem else -1 if no == destino else 0
+        limites[no] = (balanco, balanco, f'Fluxo_{no}')
+    _balanco_por_no(solver, rotas, x, limites)
+
+    status, resultado = _resolver(solver)
+    caminho = []
+    if status == 'Optimal':
+        proximo = {rotas[k][0]: rotas[k][1] for k in resultado.indices_nao_nulos(tolerancia=0.5)}
+        caminho = [origem]
+        while caminho[-1] != destino:
+            caminho.append(proximo[caminho[-1]])
+    return {'status': status, 'objetivo': resultado.objetivo, 'caminho': caminho}
+
+
+def _resolver_fluxo_maximo(dados):
+    capacidades = _arcos(dados['capacidades'])
+    origem, destino = dados['origem'], dados['destino']
+    solver = _solver('GLOP')
+    rotas = list(capacidades.keys())
+    f = [solver.NumVar(0, capacidades[rota], f'f_{k}') for k, rota in enumerate(rotas)]
+
+    # Objetivo: fluxo líquido que sai da origem
+    objetivo = solver.Objective()
+    for k, (i, j) in enumerate(rotas):
+        if i == origem and j != origem:
+            objetivo.SetCoefficient(f[k], 1)
+        elif j == origem and i != origem:
+            objetivo.SetCoefficient(f[k], -1)
+    objetivo.SetMaximization()
+
+    limites = {no: (0, 0, f'Conservacao_{no}') for no in _nos(capacidades) if no not in (origem, destino)}
+    _balanco_por_no(solver, rotas, f, limites)
+
+    status, resultado = _resolver(solver)
+    return {'status': status, 'objetivo': resultado.objetivo, 'fluxos': _arcos_nao_nulos(rotas, resultado)}
+
+
+def _resolver_transporte(dados):
+    custos = _arcos(dados['custos'])
+    capacidade, demanda = dados['capacidade'], dados['demanda']
+    solver = _solver('CBC')
+    infinito = solver.infinity()
+    rotas = list(custos.keys())
+    x = [solver.IntVar(0, infinito, f'x_{k}') for k in range(len(rotas))]
+
+    objetivo = solver.Objective()
+    for k, rota in enumerate(rotas):
+        objetivo.SetCoefficient(x[k], custos[rota])
+    objetivo.SetMinimization()
+
+    # Em termos de saída - entrada: origens enviam até a capacidade, destinos recebem a demanda
+    limites = {}
+    for no in _nos(custos):
+        if no in capacidade:
+            limites[no] = (-infinito, capacidade[no], f'Capacidade_{no}')
+        elif no in demanda:
+            limites[no] = (-demanda[no], -demanda[no], f'Demanda_{no}')
+        else:
+            limites[no] = (0, 0, f'Balanco_{no}')
+    _balanco_por_no(solver, rotas, x, limites)
+
+    status, resultado = _resolver(solver)
+    return {'status': status, 'objetivo': resultado.objetivo, 'envios': _arcos_nao_nulos(rotas, resultado)}
+
+
+RESOLVEDORES = {
+    'pl': _resolver_pl,
+    'caminho_minimo': _resolver_caminho_minimo,
+    'fluxo_maximo': _resolver_fluxo_maximo,
+    'transporte': _resolver_transporte,
+}
+
+
+def _aquecer():
+    """
+    Segura o trabalhador na barreira até que todos os processos do pool estejam de pé.
+    Enquanto nenhuma tarefa termina, o pool não tem trabalhador ocioso e precisa criar
+    um processo novo para cada tarefa enviada.
+    """
+    _BARREIRA.wait(timeout=120)
+    return os.getpid()
+
+
+def _resolver_lote(tipo, lote):
+    """
+    Resolve, uma após a outra e no mesmo solver do processo, as requisições de um lote
+    recebido em um único envio ao pool.
+    """
+    respostas = []
+    for dados in lote:
+        try:
+            respostas.append((True, RESOLVEDORES[tipo](dados)))
+        except Exception as erro:
+            respostas.append((False, f'{type(erro).__name__}: {erro}'))
+    return respostas
+
+
+def _forma(tipo, dados):
+    """Chave de agrupamento: requisições com a mesma forma entram no mesmo lote."""
+    if tipo == 'pl':
+        return tipo, len(dados['objetivo']), len(dados['restricoes'])
+    chave = {'caminho_minimo': 'arcos', 'fluxo_maximo': 'capacidades', 'transporte': 'custos'}[tipo]
+    return tipo, len(dados[chave])
+
+
+# --------------------------------------------------------------------------
+# Serviço
+# --------------------------------------------------------------------------
+# Sentinela de _ler_linha para linhas acima do limite, já respondidas com erro
+_LINHA_DESCARTADA = object()
+
+
+class _Pendente:
+    def __init__(self, tipo, dados, prazo_final, futuro):
+        self.tipo = tipo
+        self.dados = dados
+        self.prazo_final = prazo_final
+        self.futuro = futuro
+        self.chegada = time.perf_counter()
+
+
+class ServicoResolucao:
+    """
+    Servidor asyncio de JSON por linha que agrupa requisições de mesma forma em lotes
+    e as envia a um pool persistente de processos, cada um com seus solvers já criados.
+    """
+
+    def __init__(self, num_trabalhadores=None, tamanho_fila=1000, tamanho_lote=32,
+                 janela_lote=0.005, prazo_padrao=30.0):
+        self.num_trabalhadores = num_trabalhadores or os.cpu_count() or 1
+        self.tamanho_fila = tamanho_fila
+        self.tamanho_lote = tamanho_lote
+        self.janela_lote = janela_lote
+        self.prazo_padrao = prazo_padrao
+
+        self.fila = None
+        self.pool = None
+        self.em_execucao = None
+        # Referências aos lotes em andamento, para que as tarefas não sejam coletadas pelo GC
+        self.lotes_em_andamento = set()
+        self.latencias = deque(maxlen=10_000)
+        self.contadores = {'recebidas': 0, 'concluidas': 0, 'rejeitadas': 0,
+                           'expiradas': 0, 'erros': 0, 'lotes': 0}
+
+    # --- Ciclo de vida ---
+    async def servir(self, caminho_unix=None, host='127.0.0.1', porta=8765):
+        """Inicia o pool, o despachante e o servidor; roda até ser cancelado."""
+        self.fila = asyncio.Queue(maxsize=self.tamanho_fila)
+        self.em_execucao = asyncio.Semaphore(self.num_trabalhadores)
+        # 'spawn' evita que os trabalhadores herdem os sockets e o laço de eventos do processo principal
+        contexto = multiprocessing.get_context('spawn')
+        self.pool = ProcessPoolExecutor(self.num_trabalhadores, mp_context=contexto,
+                                        initializer=_inicializar_trabalhador,
+                                        initargs=(contexto.Barrier(self.num_trabalhadores),))
+        # Sobe todos os trabalhadores (e cria os solvers neles) antes de aceitar conexões
+        loop = asyncio.get_running_loop()
+        pids = await asyncio.gather(*(loop.run_in_executor(self.pool, _aquecer)
+                                      for _ in range(self.num_trabalhadores)))
+        if len(set(pids)) != self.num_trabalhadores:
+            raise RuntimeError(f'Apenas {len(set(pids))} de {self.num_trabalhadores} trabalhadores foram iniciados.')
+        despachante = asyncio.create_task(self._despachar())
+        try:
+            if caminho_unix:
+                servidor = await asyncio.start_unix_server(self._atender_conexao, path=caminho_unix,
+                                                           limit=LIMITE_LINHA)
+            else:
+                servidor = await asyncio.start_server(self._atender_conexao, host, porta, limit=LIMITE_LINHA)
+            async with servidor:
+                print(f"Serviço de resolução ouvindo em {caminho_unix or f'{host}:{porta}'}")
+                await servidor.serve_forever()
+        finally:
+            despachante.cancel()
+            for tarefa in self.lotes_em_andamento:
+                tarefa.cancel()
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+    # --- Conexões ---
+    async def _atender_conexao(self, leitor, escritor):
+        trava = asyncio.Lock()
+        tarefas = set()
+        try:
+            while linha := await self._ler_linha(leitor, escritor, trava):
+                if linha is _LINHA_DESCARTADA:
+                    continue
+                tarefa = asyncio.create_task(self._responder(linha, escritor, trava))
+                tarefas.add(tarefa)
+                tarefa.add_done_callback(tarefas.discard)
+            if tarefas:
+                await asyncio.gather(*tarefas, return_exceptions=True)
+        finally:
+            escritor.close()
+
+    async def _ler_linha(self, leitor, escritor, trava):
+        """
+        Lê uma linha completa; retorna b'' no fim da conexão. Linhas acima de LIMITE_LINHA
+        são descartadas até a próxima quebra de linha e respondidas com erro, mantendo a conexão.
+        """
+        try:
+            return await leitor.readuntil(b'\n')
+        except asyncio.IncompleteReadError as erro:
+            return erro.partial
+        except asyncio.LimitOverrunError as erro:
+            consumir = erro.consumed
+
+        try:
+            while True:
+                await leitor.readexactly(consumir)
+                try:
+                    await leitor.readuntil(b'\n')
+                    break
+                except asyncio.LimitOverrunError as erro:
+                    consumir = erro.consumed
+        except asyncio.IncompleteReadError:
+            pass
+        await self._enviar(escritor, trava, {
+            'id': None, 'ok': False,
+            'erro': f'ValueError: requisição maior que o limite de {LIMITE_LINHA} bytes.'})
+        return _LINHA_DESCARTADA
+
+    async def _enviar(self, escritor, trava, resposta):
+        async with trava:
+            escritor.write((json.dumps(resposta, ensure_ascii=False) + '\n').encode('utf-8'))
+            await escritor.drain()
+
+    async def _responder(self, linha, escritor, trava):
+        id_req = None
+        try:
+            requisicao = json.loads(linha)
+            id_req = requisicao.get('id')
+            resposta = {'id': id_req, 'ok': True, 'resultado': await self.resolver(
+                requisicao['tipo'], requisicao.get('dados'), requisicao.get('prazo'))}
+        except Exception as erro:
+            resposta = {'id': id_req, 'ok': False, 'erro': f'{type(erro).__name__}: {erro}'}
+        await self._enviar(escritor, trava, resposta)
+
+    # --- Fila, lotes e prazos ---
+    async def resolver(self, tipo, dados, prazo=None):
+        """Enfileira uma requisição e aguarda o resultado, respeitando o prazo (em segundos)."""
+        if tipo == 'stats':
+            return self.estatisticas()
+        if tipo not in RESOLVEDORES:
+            raise ValueError(f'Tipo de problema desconhecido: {tipo}')
+
+        prazo = self.prazo_padrao if prazo is None else prazo
+        if isinstance(prazo, bool) or not isinstance(prazo, (int, float)) or not 0 < prazo < math.inf:
+            raise ValueError(f'Prazo inválido: {prazo!r} (deve ser um número finito de segundos maior que zero).')
+
+        self.contadores['recebidas'] += 1
+        loop = asyncio.get_running_loop()
+        pendente = _Pendente(tipo, dados, loop.time() + prazo, loop.create_future())
+        try:
+            self.fila.put_nowait(pendente)
+        except asyncio.QueueFull:
+            # Backpressure: rejeita de imediato em vez de acumular trabalho sem limite
+            self.contadores['rejeitadas'] += 1
+            raise RuntimeError('Serviço sobrecarregado: fila cheia, tente novamente.') from None
+
+        try:
+            resultado = await asyncio.wait_for(asyncio.shield(pendente.futuro), prazo)
+        except asyncio.TimeoutError:
+            self.contadores['expiradas'] += 1
+            pendente.futuro.cancel()
+            raise TimeoutError(f'Prazo de {prazo} s excedido.') from None
+        self.latencias.append(time.perf_counter() - pendente.chegada)
+        return resultado
+
+    async def _despachar(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self.fila.get()]
+            limite = loop.time() + self.janela_lote
+            while len(lote) < self.tamanho_lote and (restante := limite - loop.time()) > 0:
+                try:
+                    lote.append(await asyncio.wait_for(self.fila.get(), restante))
+                except asyncio.TimeoutError:
+                    break
+
+            grupos = {}
+            for pendente in lote:
+                # Descarta requisições cujo prazo venceu enquanto estavam na fila
+                if pendente.futuro.done() or loop.time() >= pendente.prazo_final:
+                    continue
+                try:
+                    grupos.setdefault(_forma(pendente.tipo, pendente.dados), []).append(pendente)
+                except Exception as erro:
+                    self.contadores['erros'] += 1
+                    pendente.futuro.set_exception(ValueError(f'Dados inválidos: {erro!r}'))
+
+            for (tipo, *_), pendentes in grupos.items():
+                # Cada requisição ainda é resolvida separadamente, então o grupo é repartido
+                # entre os trabalhadores; o lote só economiza idas e voltas ao pool
+                partes = min(len(pendentes), self.num_trabalhadores)
+                for k in range(partes):
+                    # Limita os lotes em execução ao tamanho do pool; o restante espera na fila
+                    await self.em_execucao.acquire()
+                    tarefa = asyncio.create_task(self._executar_lote(tipo, pendentes[k::partes]))
+                    self.lotes_em_andamento.add(tarefa)
+                    tarefa.add_done_callback(self.lotes_em_andamento.discard)
+
+    async def _executar_lote(self, tipo, pendentes):
+        loop = asyncio.get_running_loop()
+        try:
+            self.contadores['lotes'] += 1
+            respostas = await loop.run_in_executor(
+                self.pool, _resolver_lote, tipo, [p.dados for p in pendentes])
+        except Exception as erro:
+            respostas = [(False, f'{type(erro).__name__}: {erro}')] * len(pendentes)
+        finally:
+            self.em_execucao.release()
+
+        for pendente, (ok, valor) in zip(pendentes, respostas):
+            if pendente.futuro.done():
+                continue
+            if ok:
+                self.contadores['concluidas'] += 1
+                pendente.futuro.set_result(valor)
+            else:
+                self.contadores['erros'] += 1
+                pendente.futuro.set_exception(RuntimeError(valor))
+
+    # --- Estatísticas ---
+    def estatisticas(self):
+        """Retorna contadores, tamanho da fila e percentis de latência (ms)."""
+        latencias = sorted(self.latencias)
+
+        def percentil(p):
+            if not latencias:
+                return None
+            return 1000 * latencias[min(len(latencias) - 1, int(p * len(latencias)))]
+
+        return {
+            **self.contadores,
+            'fila': self.fila.qsize() if self.fila else 0,
+            'capacidade_fila': self.tamanho_fila,
+            'trabalhadores': self.num_trabalhadores,
+            'latencia_ms': {'p50': percentil(0.50), 'p95': percentil(0.95), 'p99': percentil(0.99)},
+        }
+
+
+# --------------------------------------------------------------------------
+# Cliente
+# --------------------------------------------------------------------------
+async def enviar_requisicao(tipo, dados=None, prazo=None, caminho_unix=None, host='127.0.0.1', porta=8765):
+    """Envia uma única requisição ao serviço e retorna o resultado (ou levanta o erro recebido)."""
+    if caminho_unix:
+        leitor, escritor = await asyncio.open_unix_connection(caminho_unix, limit=LIMITE_LINHA)
+    else:
+        leitor, escritor = await asyncio.open_connection(host, porta, limit=LIMITE_LINHA)
+    try:
+        requisicao = {'id': 1, 'tipo': tipo, 'dados': dados, 'prazo': prazo}
+        escritor.write((json.dumps(requisicao, ensure_ascii=False) + '\n').encode('utf-8'))
+        await escritor.drain()
+        resposta = json.loads(await leitor.readline())
+    finally:
+        escritor.close()
+        await escritor.wait_closed()
+    if not resposta['ok']:
+        raise RuntimeError(resposta['erro'])
+    return resposta['resultado']
+
+
+# --------------------------------------------------------------------------
+# Bloco de Execução Principal
+# --------------------------------------------------------------------------
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serviço local de resolução de problemas de PO.')
+    parser.add_argument('--unix', help='Caminho do socket Unix (padrão: TCP em localhost)')
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--trabalhadores', type=int, default=None)
+    parser.add_argument('--fila', type=int, default=1000)
+    args = parser.parse_args()
+
+    servico = ServicoResolucao(num_trabalhadores=args.trabalhadores, tamanho_fila=args.fila)
+    try:
+        asyncio.run(servico.servir(caminho_unix=args.unix, porta=args.porta))
+    except KeyboardInterrupt:
+        pass
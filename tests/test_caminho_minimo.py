@@ -0,0 +1,78 @@
+import random
+
+import pytest
+
+from CaminhoMinimo import ARCOS_COM_CUSTOS, GrafoCaminhos, k_caminhos_minimos
+
+
+def _todos_os_caminhos(arcos, origem, destino):
+    """Força bruta: todos os caminhos sem ciclos, ordenados por custo."""
+    sucessores = {}
+    for i, j, custo in arcos:
+        sucessores.setdefault(i, []).append((j, custo))
+    caminhos = []
+
+    def visitar(no, caminho, custo):
+        if no == destino:
+            caminhos.append((custo, list(caminho)))
+            return
+        for vizinho, c in sucessores.get(no, ()):
+            if vizinho not in caminho:
+                caminho.append(vizinho)
+                visitar(vizinho, caminho, custo + c)
+                caminho.pop()
+
+    visitar(origem, [origem], 0)
+    caminhos.sort(key=lambda item: item[0])
+    return caminhos
+
+
+def _custo(arcos, caminho):
+    custos = {(i, j): c for i, j, c in arcos}
+    return sum(custos[a, b] for a, b in zip(caminho, caminho[1:]))
+
+
+def test_rede_de_exemplo():
+    caminhos = k_caminhos_minimos(ARCOS_COM_CUSTOS, 'A', 'K', 5)
+    assert caminhos[0] == (15, ['A', 'C', 'F', 'H', 'K'])
+    assert [custo for custo, _ in caminhos] == [15, 16, 16, 17, 17]
+
+
+@pytest.mark.parametrize('semente', range(5))
+def test_confere_com_forca_bruta(semente):
+    aleatorio = random.Random(semente)
+    for _ in range(300):
+        n = aleatorio.randint(2, 9)
+        trechos = {}
+        for _ in range(aleatorio.randint(1, 4 * n)):
+            i, j = aleatorio.randrange(n), aleatorio.randrange(n)
+            if i != j:
+                trechos[i, j] = aleatorio.randint(0, 6)
+        arcos = [(i, j, c) for (i, j), c in trechos.items()]
+        k = aleatorio.randint(1, 30)
+
+        esperado = _todos_os_caminhos(arcos, 0, n - 1)
+        obtido = k_caminhos_minimos(arcos, 0, n - 1, k)
+
+        assert [c for c, _ in obtido] == [c for c, _ in esperado[:k]]
+        assert len({tuple(caminho) for _, caminho in obtido}) == len(obtido)
+        validos = {tuple(caminho) for _, caminho in esperado}
+        for custo, caminho in obtido:
+            assert tuple(caminho) in validos
+            assert _custo(arcos, caminho) == custo
+
+
+def test_grafo_pronto_reaproveita_arvore():
+    grafo = GrafoCaminhos(ARCOS_COM_CUSTOS, max_arvores=1)
+    assert k_caminhos_minimos(grafo, 'A', 'K', 5) == k_caminhos_minimos(ARCOS_COM_CUSTOS, 'A', 'K', 5)
+    arvore = grafo.arvore('K')
+    assert grafo.arvore('K') is arvore
+    k_caminhos_minimos(grafo, 'A', 'H', 3)
+    assert grafo.arvore('K') is not arvore
+
+
+def test_sem_caminho_e_custo_negativo():
+    assert k_caminhos_minimos([('A', 'B', 1)], 'B', 'A', 3) == []
+    assert k_caminhos_minimos(ARCOS_COM_CUSTOS, 'A', 'K', 0) == []
+    with pytest.raises(ValueError):
+        k_caminhos_minimos([('A', 'B', -1)], 'A', 'B', 1)
@@ -0,0 +1,74 @@
+import csv
+
+import numpy as np
+import pytest
+from ortools.linear_solver import pywraplp
+
+from ExtracaoResultados import ResultadoSolucao, extrair_resultado_ortools, indices_ortools
+
+
+def _modelo_resolvido():
+    # max 4x + 3y  s.a.  x + 3y <= 7, 2x + 2y <= 8, x + y <= 3, y <= 2
+    solver = pywraplp.Solver.CreateSolver('GLOP')
+    x = solver.NumVar(0, solver.infinity(), 'x')
+    y = solver.NumVar(0, solver.infinity(), 'y')
+    for nome, (a, b, rhs) in {'r1': (1, 3, 7), 'r2': (2, 2, 8), 'r3': (1, 1, 3), 'r4': (0, 1, 2)}.items():
+        restricao = solver.Constraint(-solver.infinity(), rhs, nome)
+        restricao.SetCoefficient(x, a)
+        restricao.SetCoefficient(y, b)
+    solver.Maximize(4 * x + 3 * y)
+    status = solver.Solve()
+    return solver, status, [x, y]
+
+
+def test_extracao_em_bloco_confere_com_o_solver():
+    solver, status, variaveis = _modelo_resolvido()
+    resultado = extrair_resultado_ortools(solver, status=status)
+
+    assert resultado.objetivo == pytest.approx(12)
+    assert resultado.nomes_variaveis == ['x', 'y']
+    np.testing.assert_allclose(resultado.valores, [v.solution_value() for v in variaveis])
+    np.testing.assert_allclose(resultado.custos_reduzidos, [v.reduced_cost() for v in variaveis])
+    np.testing.assert_allclose(resultado.duais, [c.dual_value() for c in solver.constraints()])
+
+    invertido = extrair_resultado_ortools(solver, indices_ortools(variaveis[::-1]))
+    assert invertido.nomes_variaveis == ['y', 'x']
+    np.testing.assert_allclose(invertido.valores, resultado.valores[::-1])
+
+
+def test_csv_grava_apenas_nao_nulos(tmp_path):
+    solver, status, _ = _modelo_resolvido()
+    resultado = extrair_resultado_ortools(solver, status=status)
+    caminho = tmp_path / 'variaveis.csv'
+    resultado.escrever_csv(caminho)
+
+    with open(caminho, newline='', encoding='utf-8') as arquivo:
+        linhas = list(csv.reader(arquivo))
+    assert linhas[0] == ['variavel', 'valor', 'custo_reduzido']
+    assert [linha[0] for linha in linhas[1:]] == [resultado.nomes_variaveis[i] for i in resultado.indices_nao_nulos()]
+
+
+def test_parquet_vazio_mantem_nomes_como_texto(tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    solver, status, _ = _modelo_resolvido()
+    resultado = extrair_resultado_ortools(solver, status=status)
+
+    caminho = tmp_path / 'vazio.parquet'
+    resultado.escrever_parquet(caminho, tolerancia=np.inf)
+    tabela = pq.read_table(caminho)
+    assert tabela.num_rows == 0
+    assert tabela.schema.field('variavel').type == pa.string()
+
+    # Lista de nomes vazia: o tipo não pode ser deduzido do dtype (seria double)
+    vazio = ResultadoSolucao('Optimal', 0.0, [], np.array([]), np.array([]), [], np.array([]))
+    caminho = tmp_path / 'sem_variaveis.parquet'
+    vazio.escrever_parquet(caminho)
+    assert pq.read_table(caminho).schema.field('variavel').type == pa.string()
+
+    caminho = tmp_path / 'duais.parquet'
+    resultado.escrever_duais_parquet(caminho)
+    tabela = pq.read_table(caminho)
+    assert tabela.schema.field('restricao').type == pa.string()
+    assert tabela.column('restricao').to_pylist() == [
+        resultado.nomes_restricoes[i] for i in np.flatnonzero(np.abs(resultado.duais) > 1e-9)]
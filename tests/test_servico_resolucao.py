@@ -0,0 +1,76 @@
+import asyncio
+import os
+
+import pytest
+
+from ServicoResolucao import ServicoResolucao, enviar_requisicao
+
+# Problema P1 do PuLPLinear: máximo 12
+PL = {'tipo': 'max', 'objetivo': [4, 3],
+      'restricoes': [{'coefs': [1, 3], 'op': '<=', 'rhs': 7},
+                     {'coefs': [2, 2], 'op': '<=', 'rhs': 8},
+                     {'coefs': [1, 1], 'op': '<=', 'rhs': 3},
+                     {'coefs': [0, 1], 'op': '<=', 'rhs': 2}]}
+
+
+def _com_servico(tmp_path, cenario, **opcoes):
+    """Sobe o serviço em um socket Unix temporário, roda o cenário e encerra o serviço."""
+    caminho = str(tmp_path / 'servico.sock')
+
+    async def principal():
+        servico = ServicoResolucao(num_trabalhadores=2, **opcoes)
+        servidor = asyncio.create_task(servico.servir(caminho_unix=caminho))
+        while not os.path.exists(caminho):
+            assert not servidor.done(), servidor.exception()
+            await asyncio.sleep(0.05)
+        try:
+            await cenario(servico, caminho)
+        finally:
+            servidor.cancel()
+            await asyncio.gather(servidor, return_exceptions=True)
+
+    asyncio.run(principal())
+
+
+def test_resolve_pelo_socket_e_reporta_estatisticas(tmp_path):
+    async def cenario(servico, caminho):
+        respostas = await asyncio.gather(*(enviar_requisicao('pl', PL, caminho_unix=caminho) for _ in range(10)))
+        assert all(r['status'] == 'Optimal' for r in respostas)
+        assert respostas[0]['objetivo'] == pytest.approx(12)
+
+        estatisticas = await enviar_requisicao('stats', caminho_unix=caminho)
+        assert estatisticas['recebidas'] == estatisticas['concluidas'] == 10
+        assert estatisticas['lotes'] >= 1
+        assert estatisticas['latencia_ms']['p50'] is not None
+
+    _com_servico(tmp_path, cenario)
+
+
+def test_fila_cheia_rejeita_requisicoes(tmp_path):
+    async def cenario(servico, _):
+        # Todas as requisições entram na fila antes que o despachante volte a rodar
+        respostas = await asyncio.gather(*(servico.resolver('pl', PL) for _ in range(20)),
+                                         return_exceptions=True)
+        rejeitadas = [r for r in respostas if isinstance(r, RuntimeError)]
+        assert rejeitadas and all('fila cheia' in str(r) for r in rejeitadas)
+        assert all(r['objetivo'] == pytest.approx(12) for r in respostas if isinstance(r, dict))
+
+        estatisticas = servico.estatisticas()
+        assert estatisticas['rejeitadas'] == len(rejeitadas)
+        assert estatisticas['concluidas'] == 20 - len(rejeitadas)
+
+    _com_servico(tmp_path, cenario, tamanho_fila=2)
+
+
+def test_prazo_vencido_e_prazo_invalido(tmp_path):
+    async def cenario(servico, _):
+        with pytest.raises(TimeoutError):
+            await servico.resolver('pl', PL, prazo=1e-6)
+        assert servico.estatisticas()['expiradas'] == 1
+
+        for prazo in ('abc', -1, 0, True, float('inf')):
+            with pytest.raises(ValueError):
+                await servico.resolver('pl', PL, prazo=prazo)
+        assert servico.estatisticas()['recebidas'] == 1
+
+    _com_servico(tmp_path, cenario)